@@ -1,168 +1,319 @@
-from collections import defaultdict
-from inspect import isawaitable
-from typing import NamedTuple
+import sys
+from asyncio import new_event_loop
+from functools import lru_cache, wraps
+from inspect import Signature
+from typing import List, Optional
 
-from pytest import mark
+from pytest import fixture, mark
 
 from graphql.execution import execute, execute_sync, ExecutionResult
-from graphql.language import parse
+from graphql.language import DocumentNode, parse
 from graphql.type import (
+    GraphQLAbstractType,
     GraphQLBoolean,
     GraphQLField,
     GraphQLInterfaceType,
     GraphQLList,
+    GraphQLNamedType,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
     GraphQLUnionType,
+    assert_valid_schema,
 )
 
 
+@fixture(scope="module")
+def event_loop():
+    """Use one event loop for all async tests in this module."""
+    loop = new_event_loop()
+    yield loop
+    loop.close()
+
+
+_PETS_QUERY = """
+{
+  pets {
+    name
+    ... on Dog {
+      woofs
+    }
+    ... on Cat {
+      meows
+    }
+  }
+}
+"""
+
+_PETS_UNION_QUERY = """
+{
+  pets {
+    ... on Dog {
+      name
+      woofs
+    }
+    ... on Cat {
+      name
+      meows
+    }
+  }
+}
+"""
+
+_FOO_QUERY = "{ foo { bar } }"
+
+
 def sync_and_async(spec):
-    """Decorator for running a test synchronously and asynchronously."""
-    return mark.asyncio(
-        mark.parametrize("sync", (True, False), ids=("sync", "async"))(spec)
-    )
+    """Decorator for running a test synchronously and asynchronously.
+
+    Instead of parametrizing the test, this adds two separate tests with the
+    suffixes "_sync" and "_async" to the namespace of the caller. The decorator
+    itself returns None, so that the undecorated name is not collected as a test.
+    """
+    namespace = sys._getframe(1).f_locals
+
+    def add_variant(sync):
+        @wraps(spec)
+        async def variant():
+            await spec(sync)
+
+        suffix = "_sync" if sync else "_async"
+        variant.__name__ = spec.__name__ + suffix
+        variant.__qualname__ = spec.__qualname__ + suffix
+        # the variant does not take the sync flag as a fixture
+        variant.__signature__ = Signature()  # type: ignore
+        namespace[variant.__name__] = mark.asyncio(variant)
+
+    add_variant(True)
+    add_variant(False)
 
 
 async def execute_query(
-    schema: GraphQLSchema, query: str, sync=True
+    schema: GraphQLSchema, query: str, sync: bool = True
 ) -> ExecutionResult:
     """Execute the query against the given schema synchronously or asynchronously."""
-    assert isinstance(schema, GraphQLSchema)
-    assert isinstance(query, str)
-    assert isinstance(sync, bool)
-    document = parse(query)
-    result = (execute_sync if sync else execute)(schema, document)  # type: ignore
-    if not sync and isawaitable(result):
-        result = await result
-    assert isinstance(result, ExecutionResult)
-    return result
+    if sync:
+        return _execute_query_sync(schema, query)
+    return await _execute_query_async(schema, query)
 
 
+def _execute_query_sync(schema: GraphQLSchema, query: str) -> ExecutionResult:
+    """Execute the query against the given schema synchronously."""
+    return execute_sync(schema, _parse_cached(query))
+
+
+async def _execute_query_async(schema: GraphQLSchema, query: str) -> ExecutionResult:
+    """Execute the query against the given schema asynchronously."""
+    result = execute(schema, _parse_cached(query))
+    # the result is only awaitable if there were async resolvers
+    if isinstance(result, ExecutionResult):
+        return result
+    return await result
+
+
+@lru_cache(maxsize=128)
+def _parse_cached(query: str) -> DocumentNode:
+    """Parse the given query, reusing the document if it has already been parsed."""
+    return parse(query)
+
+
+@lru_cache(maxsize=None)
 def get_is_type_of(type_, sync=True):
     """Get a sync or async is_type_of function for the given type."""
     if sync:
 
         def is_type_of(obj, _info):
-            return isinstance(obj, type_)
+            return obj.__class__ is type_
 
     else:
 
         async def is_type_of(obj, _info):
-            return isinstance(obj, type_)
+            return obj.__class__ is type_
 
     return is_type_of
 
 
 def get_is_type_of_error(sync=True):
     """Get a sync or async is_type_of function that raises an error."""
-    error = RuntimeError("We are testing this error")
+    # raise a new error every time, since the schema with this function is cached
     if sync:
 
         def is_type_of(*_args):
-            raise error
+            raise RuntimeError("We are testing this error")
 
     else:
 
         async def is_type_of(*_args):
-            raise error
+            raise RuntimeError("We are testing this error")
 
     return is_type_of
 
 
-def get_type_resolver(types, sync=True):
+def get_type_resolver(types_map, sync=True):
     """Get a sync or async type resolver for the given type map."""
     if sync:
 
         def resolve(obj, _info, _type):
-            return resolve_thunk(types)[obj.__class__]
+            return types_map[obj.__class__]
 
     else:
 
         async def resolve(obj, _info, _type):
-            return resolve_thunk(types)[obj.__class__]
+            return types_map[obj.__class__]
 
     return resolve
 
 
-def resolve_thunk(thunk):
-    return thunk() if callable(thunk) else thunk
+class Dog:
 
+    __slots__ = "name", "woofs"
 
-class Dog(NamedTuple):
+    def __init__(self, name: str, woofs: bool):
+        self.name = name
+        self.woofs = woofs
 
-    name: str
-    woofs: bool
 
+class Cat:
 
-class Cat(NamedTuple):
+    __slots__ = "name", "meows"
 
-    name: str
-    meows: bool
+    def __init__(self, name: str, meows: bool):
+        self.name = name
+        self.meows = meows
 
 
-class Human(NamedTuple):
+class Human:
 
-    name: str
+    __slots__ = ("name",)
 
+    def __init__(self, name: str):
+        self.name = name
 
-def describe_execute_handles_synchronous_execution_of_abstract_types():
-    @sync_and_async
-    async def is_type_of_used_to_resolve_runtime_type_for_interface(sync):
-        pet_type = GraphQLInterfaceType("Pet", {"name": GraphQLField(GraphQLString)})
 
-        dog_type = GraphQLObjectType(
-            "Dog",
-            {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-            is_type_of=get_is_type_of(Dog, sync),
-        )
+_STR_FIELD = GraphQLField(GraphQLString)
+_BOOL_FIELD = GraphQLField(GraphQLBoolean)
 
-        cat_type = GraphQLObjectType(
-            "Cat",
-            {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-            is_type_of=get_is_type_of(Cat, sync),
+_ODIE = Dog("Odie", True)
+_GARFIELD = Cat("Garfield", False)
+_JON = Human("Jon")
+
+_PETS_DOG_CAT = (_ODIE, _GARFIELD)
+_PETS_WITH_HUMAN = (_ODIE, _GARFIELD, _JON)
+
+
+_EMPTY_LIST: List = []
+
+
+class _AlwaysEmpty(dict):
+    """A type map that returns the same empty list for all keys."""
+
+    def __missing__(self, _key):
+        return _EMPTY_LIST
+
+
+def _resolve_pets(*_args):
+    return _PETS_DOG_CAT
+
+
+def _resolve_pets_only_dog(*_args):
+    return (_ODIE,)
+
+
+def _resolve_pets_with_human(*_args):
+    return _PETS_WITH_HUMAN
+
+
+def _resolve_foo_dummy(*_args):
+    return "dummy"
+
+
+@lru_cache(maxsize=None)
+def _make_pet_schema(sync: bool, mode: str) -> GraphQLSchema:
+    """Get a cached schema with Pet, Dog and Cat types for the given mode.
+
+    With the modes "interface" and "union", Pet is an interface or a union type
+    and the runtime type is resolved via is_type_of. With the mode
+    "is_type_of_error", the is_type_of function of Dog raises an error, and with
+    the mode "type_name", the Pet interface resolves the type by its name.
+    """
+    if mode not in ("interface", "union", "is_type_of_error", "type_name"):
+        raise TypeError(f"Unexpected pet schema mode: {mode!r}.")
+    is_interface = mode != "union"
+    if is_interface:
+        pet_interface = GraphQLInterfaceType(
+            "Pet",
+            {"name": _STR_FIELD},
+            resolve_type=get_type_resolver({Dog: "Dog", Cat: "Cat"}, sync)
+            if mode == "type_name"
+            else None,
         )
+        interfaces = [pet_interface]
+    else:
+        interfaces = None
 
-        schema = GraphQLSchema(
-            GraphQLObjectType(
-                "Query",
-                {
-                    "pets": GraphQLField(
-                        GraphQLList(pet_type),
-                        resolve=lambda *_args: [
-                            Dog("Odie", True),
-                            Cat("Garfield", False),
-                        ],
-                    )
-                },
-            ),
-            types=[cat_type, dog_type],
+    if mode == "is_type_of_error":
+        dog_is_type_of, cat_is_type_of = get_is_type_of_error(sync), None
+    elif mode == "type_name":
+        dog_is_type_of = cat_is_type_of = None
+    else:
+        dog_is_type_of = get_is_type_of(Dog, sync)
+        cat_is_type_of = get_is_type_of(Cat, sync)
+
+    dog_type = GraphQLObjectType(
+        "Dog",
+        {
+            "name": _STR_FIELD,
+            "woofs": _BOOL_FIELD,
+        },
+        interfaces=interfaces,
+        is_type_of=dog_is_type_of,
+    )
+
+    cat_type = GraphQLObjectType(
+        "Cat",
+        {
+            "name": _STR_FIELD,
+            "meows": _BOOL_FIELD,
+        },
+        interfaces=interfaces,
+        is_type_of=cat_is_type_of,
+    )
+
+    pet_type: GraphQLAbstractType
+    types: Optional[List[GraphQLNamedType]]
+    if is_interface:
+        pet_type = pet_interface
+        # keep the order of the types from the original tests
+        types = (
+            [dog_type, cat_type] if mode == "is_type_of_error" else [cat_type, dog_type]
         )
+    else:
+        pet_type = GraphQLUnionType("Pet", [cat_type, dog_type])
+        types = None
 
-        query = """
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
             {
-              pets {
-                name
-                ... on Dog {
-                  woofs
-                }
-                ... on Cat {
-                  meows
-                }
-              }
-            }
-            """
+                "pets": GraphQLField(
+                    GraphQLList(pet_type),
+                    resolve=_resolve_pets,
+                )
+            },
+        ),
+        types=types,
+    )
+    # validate the schema here, so that execution can use the cached result
+    assert_valid_schema(schema)
+    return schema
 
-        assert await execute_query(schema, query, sync) == (
+
+def describe_execute_handles_synchronous_execution_of_abstract_types():
+    @sync_and_async
+    async def is_type_of_used_to_resolve_runtime_type_for_interface(sync):
+        schema = _make_pet_schema(sync, "interface")
+
+        assert await execute_query(schema, _PETS_QUERY, sync) == (
             {
                 "pets": [
                     {"name": "Odie", "woofs": True},
@@ -174,69 +325,19 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def is_type_of_can_throw(sync):
-        pet_type = GraphQLInterfaceType("Pet", {"name": GraphQLField(GraphQLString)})
-
-        dog_type = GraphQLObjectType(
-            "Dog",
-            {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-            is_type_of=get_is_type_of_error(sync),
-        )
-
-        cat_type = GraphQLObjectType(
-            "Cat",
-            {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-            is_type_of=None,
-        )
-
-        schema = GraphQLSchema(
-            GraphQLObjectType(
-                "Query",
-                {
-                    "pets": GraphQLField(
-                        GraphQLList(pet_type),
-                        resolve=lambda *_args: [
-                            Dog("Odie", True),
-                            Cat("Garfield", False),
-                        ],
-                    )
-                },
-            ),
-            types=[dog_type, cat_type],
-        )
-
-        query = """
-            {
-              pets {
-                name
-                ... on Dog {
-                  woofs
-                }
-                ... on Cat {
-                  meows
-                }
-              }
-            }
-            """
+        schema = _make_pet_schema(sync, "is_type_of_error")
 
-        assert await execute_query(schema, query, sync) == (
+        assert await execute_query(schema, _PETS_QUERY, sync) == (
             {"pets": [None, None]},
             [
                 {
                     "message": "We are testing this error",
-                    "locations": [(3, 15)],
+                    "locations": [(3, 3)],
                     "path": ["pets", 0],
                 },
                 {
                     "message": "We are testing this error",
-                    "locations": [(3, 15)],
+                    "locations": [(3, 3)],
                     "path": ["pets", 1],
                 },
             ],
@@ -244,13 +345,13 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def is_type_of_with_no_suitable_type(sync):
-        pet_type = GraphQLInterfaceType("Pet", {"name": GraphQLField(GraphQLString)})
+        pet_type = GraphQLInterfaceType("Pet", {"name": _STR_FIELD})
 
         dog_type = GraphQLObjectType(
             "Dog",
             {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
+                "name": _STR_FIELD,
+                "woofs": _BOOL_FIELD,
             },
             interfaces=[pet_type],
             is_type_of=get_is_type_of(Cat, sync),
@@ -262,7 +363,7 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "pets": GraphQLField(
                         GraphQLList(pet_type),
-                        resolve=lambda *_args: [Dog("Odie", True)],
+                        resolve=_resolve_pets_only_dog,
                     )
                 },
             ),
@@ -282,7 +383,7 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
         message = (
             "Abstract type 'Pet' must resolve to an Object type at runtime"
-            " for field 'Query.pets' with value ('Odie', True), received 'None'."
+            " for field 'Query.pets' with value <Dog instance>, received 'None'."
             " Either the 'Pet' type should provide a 'resolve_type' function"
             " or each possible type should provide an 'is_type_of' function."
         )
@@ -293,57 +394,9 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def is_type_of_used_to_resolve_runtime_type_for_union(sync):
-        dog_type = GraphQLObjectType(
-            "Dog",
-            {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
-            },
-            is_type_of=get_is_type_of(Dog, sync),
-        )
-
-        cat_type = GraphQLObjectType(
-            "Cat",
-            {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
-            },
-            is_type_of=get_is_type_of(Cat, sync),
-        )
-
-        pet_type = GraphQLUnionType("Pet", [cat_type, dog_type])
-
-        schema = GraphQLSchema(
-            GraphQLObjectType(
-                "Query",
-                {
-                    "pets": GraphQLField(
-                        GraphQLList(pet_type),
-                        resolve=lambda *_args: [
-                            Dog("Odie", True),
-                            Cat("Garfield", False),
-                        ],
-                    )
-                },
-            )
-        )
-
-        query = """
-            {
-              pets {
-                ... on Dog {
-                  name
-                  woofs
-                }
-                ... on Cat {
-                  name
-                  meows
-                }
-              }
-            }
-            """
+        schema = _make_pet_schema(sync, "union")
 
-        assert await execute_query(schema, query, sync) == (
+        assert await execute_query(schema, _PETS_UNION_QUERY, sync) == (
             {
                 "pets": [
                     {"name": "Odie", "woofs": True},
@@ -355,36 +408,34 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def resolve_type_on_interface_yields_useful_error(sync):
-        cat_type: GraphQLObjectType
-        dog_type: GraphQLObjectType
-        human_type: GraphQLObjectType
+        pet_type: GraphQLInterfaceType
 
-        pet_type = GraphQLInterfaceType(
-            "Pet",
-            {"name": GraphQLField(GraphQLString)},
-            resolve_type=get_type_resolver(
-                lambda: {Dog: dog_type, Cat: cat_type, Human: human_type}, sync
-            ),
-        )
-
-        human_type = GraphQLObjectType("Human", {"name": GraphQLField(GraphQLString)})
+        human_type = GraphQLObjectType("Human", {"name": _STR_FIELD})
 
         dog_type = GraphQLObjectType(
             "Dog",
             {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
+                "name": _STR_FIELD,
+                "woofs": _BOOL_FIELD,
             },
-            interfaces=[pet_type],
+            interfaces=lambda: [pet_type],
         )
 
         cat_type = GraphQLObjectType(
             "Cat",
             {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
+                "name": _STR_FIELD,
+                "meows": _BOOL_FIELD,
             },
-            interfaces=[pet_type],
+            interfaces=lambda: [pet_type],
+        )
+
+        pet_type = GraphQLInterfaceType(
+            "Pet",
+            {"name": _STR_FIELD},
+            resolve_type=get_type_resolver(
+                {Dog: dog_type, Cat: cat_type, Human: human_type}, sync
+            ),
         )
 
         schema = GraphQLSchema(
@@ -393,32 +444,14 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "pets": GraphQLField(
                         GraphQLList(pet_type),
-                        resolve=lambda *_args: [
-                            Dog("Odie", True),
-                            Cat("Garfield", False),
-                            Human("Jon"),
-                        ],
+                        resolve=_resolve_pets_with_human,
                     )
                 },
             ),
             types=[cat_type, dog_type],
         )
 
-        query = """
-            {
-              pets {
-                name
-                ... on Dog {
-                  woofs
-                }
-                ... on Cat {
-                  meows
-                }
-              }
-            }
-            """
-
-        assert await execute_query(schema, query, sync) == (
+        assert await execute_query(schema, _PETS_QUERY, sync) == (
             {
                 "pets": [
                     {"name": "Odie", "woofs": True},
@@ -430,7 +463,7 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "message": "Runtime Object type 'Human'"
                     " is not a possible type for 'Pet'.",
-                    "locations": [{"line": 3, "column": 15}],
+                    "locations": [{"line": 3, "column": 3}],
                     "path": ["pets", 2],
                 }
             ],
@@ -438,21 +471,21 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def resolve_type_on_union_yields_useful_error(sync):
-        human_type = GraphQLObjectType("Human", {"name": GraphQLField(GraphQLString)})
+        human_type = GraphQLObjectType("Human", {"name": _STR_FIELD})
 
         dog_type = GraphQLObjectType(
             "Dog",
             {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
+                "name": _STR_FIELD,
+                "woofs": _BOOL_FIELD,
             },
         )
 
         cat_type = GraphQLObjectType(
             "Cat",
             {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
+                "name": _STR_FIELD,
+                "meows": _BOOL_FIELD,
             },
         )
 
@@ -470,32 +503,13 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "pets": GraphQLField(
                         GraphQLList(pet_type),
-                        resolve=lambda *_: [
-                            Dog("Odie", True),
-                            Cat("Garfield", False),
-                            Human("Jon"),
-                        ],
+                        resolve=_resolve_pets_with_human,
                     )
                 },
             )
         )
 
-        query = """
-            {
-              pets {
-                ... on Dog {
-                  name
-                  woofs
-                }
-                ... on Cat {
-                  name
-                  meows
-                }
-              }
-            }
-            """
-
-        assert await execute_query(schema, query, sync) == (
+        assert await execute_query(schema, _PETS_UNION_QUERY, sync) == (
             {
                 "pets": [
                     {"name": "Odie", "woofs": True},
@@ -507,7 +521,7 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "message": "Runtime Object type 'Human'"
                     " is not a possible type for 'Pet'.",
-                    "locations": [{"line": 3, "column": 15}],
+                    "locations": [{"line": 3, "column": 3}],
                     "path": ["pets", 2],
                 }
             ],
@@ -517,26 +531,26 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
     async def returning_invalid_value_from_resolve_type_yields_useful_error(sync):
         foo_interface = GraphQLInterfaceType(
             "FooInterface",
-            {"bar": GraphQLField(GraphQLString)},
+            {"bar": _STR_FIELD},
             # this type resolver always returns an empty list instead of a type
-            resolve_type=get_type_resolver(defaultdict(list), sync),
+            resolve_type=get_type_resolver(_AlwaysEmpty(), sync),
         )
 
         foo_object = GraphQLObjectType(
             "FooObject",
-            {"bar": GraphQLField(GraphQLString)},
+            {"bar": _STR_FIELD},
             interfaces=[foo_interface],
         )
 
         schema = GraphQLSchema(
             GraphQLObjectType(
                 "Query",
-                {"foo": GraphQLField(foo_interface, resolve=lambda *_args: "dummy")},
+                {"foo": GraphQLField(foo_interface, resolve=_resolve_foo_dummy)},
             ),
             types=[foo_object],
         )
 
-        assert await execute_query(schema, "{ foo { bar } }", sync) == (
+        assert await execute_query(schema, _FOO_QUERY, sync) == (
             {"foo": None},
             [
                 {
@@ -553,13 +567,11 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def missing_both_resolve_type_and_is_type_of_yields_useful_error(sync):
-        foo_interface = GraphQLInterfaceType(
-            "FooInterface", {"bar": GraphQLField(GraphQLString)}
-        )
+        foo_interface = GraphQLInterfaceType("FooInterface", {"bar": _STR_FIELD})
 
         foo_object = GraphQLObjectType(
             "FooObject",
-            {"bar": GraphQLField(GraphQLString)},
+            {"bar": _STR_FIELD},
             interfaces=[foo_interface],
         )
 
@@ -569,14 +581,14 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
                 {
                     "foo": GraphQLField(
                         foo_interface,
-                        resolve=lambda *_: "dummy",
+                        resolve=_resolve_foo_dummy,
                     )
                 },
             ),
             types=[foo_object],
         )
 
-        assert await execute_query(schema, "{ foo { bar } }", sync) == (
+        assert await execute_query(schema, _FOO_QUERY, sync) == (
             {"foo": None},
             [
                 {
@@ -593,57 +605,9 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
 
     @sync_and_async
     async def resolve_type_allows_resolving_with_type_name(sync):
-        pet_type = GraphQLInterfaceType(
-            "Pet",
-            {"name": GraphQLField(GraphQLString)},
-            resolve_type=get_type_resolver({Dog: "Dog", Cat: "Cat"}, sync),
-        )
-
-        dog_type = GraphQLObjectType(
-            "Dog",
-            {
-                "name": GraphQLField(GraphQLString),
-                "woofs": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-        )
+        schema = _make_pet_schema(sync, "type_name")
 
-        cat_type = GraphQLObjectType(
-            "Cat",
-            {
-                "name": GraphQLField(GraphQLString),
-                "meows": GraphQLField(GraphQLBoolean),
-            },
-            interfaces=[pet_type],
-        )
-
-        schema = GraphQLSchema(
-            GraphQLObjectType(
-                "Query",
-                {
-                    "pets": GraphQLField(
-                        GraphQLList(pet_type),
-                        resolve=lambda *_: [Dog("Odie", True), Cat("Garfield", False)],
-                    )
-                },
-            ),
-            types=[cat_type, dog_type],
-        )
-
-        query = """
-            {
-              pets {
-                name
-                ... on Dog {
-                  woofs
-                }
-                ... on Cat {
-                  meows
-                }
-              }
-            }"""
-
-        assert await execute_query(schema, query, sync) == (
+        assert await execute_query(schema, _PETS_QUERY, sync) == (
             {
                 "pets": [
                     {"name": "Odie", "woofs": True},